@@ -7,15 +7,20 @@ The generator ensures ASCII compliance and includes profanity filtering.
 """
 
 import sys
+import hashlib
 import logging
+import logging.handlers
 import os
+import pickle
 import random
 import warnings
 import zipfile
 import tkinter as tk
+from collections import Counter, deque
+from operator import itemgetter
 from tkinter import ttk, messagebox
-from threading import Thread
-from typing import cast
+from threading import Event, Lock, Thread
+from typing import Callable, cast
 
 # nltk 3.10.1 ships an import finder (nltk/inisec.py) that blocks any module
 # resolving to a path beneath the current working directory. It tests with
@@ -61,32 +66,79 @@ stream_formatter = logging.Formatter("%(levelname)s - %(message)s")
 stream_handler.setFormatter(stream_formatter)
 logger.addHandler(stream_handler)
 
+# How often the log window picks up queued records, and how much history it keeps
+LOG_POLL_MS = 50
+MAX_LOG_LINES = 1000
+
+# Filtered word lists are kept on disk between runs. Bump WORD_CACHE_FORMAT
+# whenever the word filter changes so older files are rebuilt, not trusted.
+WORD_CACHE_PATH = os.path.join(
+	os.path.expanduser("~"), ".cache", "ascii_username_generator", "words.pkl"
+)
+WORD_CACHE_FORMAT = 1
+
+
+def append_to_log(text_widget: tk.Text, text: str) -> None:
+	"""
+	Append a block of text to a log widget, scrolling once at the end.
+
+	Scrolls only if the view was already at the bottom, so a user reading
+	older lines is not pulled away by new output.
+
+	Args:
+		text_widget (tk.Text): The log widget to append to.
+		text (str): Text to append, including any trailing newline.
+	"""
+	autoscroll = text_widget.yview()[1] >= 1.0
+	text_widget.insert(tk.END, text)
+	if autoscroll:
+		text_widget.see(tk.END)  # Ensure the latest log is visible
+
 
 class TextHandler(logging.Handler):
 	"""
-	Custom logging handler that redirects log messages to a Tkinter Text widget.
+	Custom logging handler that queues log messages for a Tkinter Text widget.
+
+	Records can arrive from any thread, but Tk widgets may only be touched from
+	the Tk thread. emit() therefore only buffers the formatted message; drain()
+	writes everything pending in one insert and is polled from the Tk thread.
 	"""
 
-	def __init__(self, text_widget: tk.Text) -> None:
+	def __init__(self, text_widget: tk.Text, max_pending: int = 2000) -> None:
 		"""
 		Initialize the TextHandler with the target Text widget.
 
 		Args:
 			text_widget (tk.Text): The Text widget where logs will be displayed.
+			max_pending (int): Most messages kept between drains; older ones are dropped.
 		"""
 		super().__init__()
 		self.text_widget = text_widget
+		self.buffer: deque[str] = deque(maxlen=max_pending)
+		# Separate from Handler.lock, which handle() already holds around emit()
+		self._buffer_lock = Lock()
 
 	def emit(self, record: logging.LogRecord) -> None:
 		"""
-		Process and display a log record in the Text widget.
+		Queue a log record for display in the Text widget.
 
 		Args:
 			record (logging.LogRecord): The log record to be displayed.
 		"""
 		msg = self.format(record)
-		self.text_widget.insert(tk.END, msg + '\n')
-		self.text_widget.see(tk.END)  # Ensure the latest log is visible
+		with self._buffer_lock:
+			self.buffer.append(msg)
+
+	def drain(self) -> None:
+		"""
+		Write all queued messages to the Text widget. Must run on the Tk thread.
+		"""
+		with self._buffer_lock:
+			if not self.buffer:
+				return
+			pending = list(self.buffer)
+			self.buffer.clear()
+		append_to_log(self.text_widget, "\n".join(pending) + "\n")
 
 
 class UsernameGenerator:
@@ -94,6 +146,21 @@ class UsernameGenerator:
 	GUI-based username generator supporting multiple languages and customization options.
 	"""
 
+	# Case style to the str method that applies it
+	_CASE_FORMATS: dict[str, Callable[[str], str]] = {
+		"lowercase": str.lower,
+		"uppercase": str.upper,
+		"capitalize": str.capitalize,
+	}
+
+	# Every possible number suffix per style, already zero-padded, so picking one
+	# is a single choice() instead of randint plus formatting.
+	_SUFFIX_POOLS: dict[str, tuple[str, ...]] = {
+		"1digit": tuple(str(i) for i in range(10)),
+		"2digit": tuple(f"{i:02d}" for i in range(100)),
+		"3digit": tuple(f"{i:03d}" for i in range(1000)),
+	}
+
 	def __init__(self, root: tk.Tk) -> None:
 		"""
 		Initialize the username generator application.
@@ -105,6 +172,7 @@ class UsernameGenerator:
 		self.root = root
 		self.root.title("ASCII Username Generator")
 		self.root.geometry("900x800")
+		self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
 		# Configure window resizing behavior
 		self.root.rowconfigure(0, weight=1)
@@ -115,20 +183,34 @@ class UsernameGenerator:
 		self.number_var: tk.StringVar = tk.StringVar(value="")
 		self.count_var: tk.StringVar = tk.StringVar(value="")
 		self.log_var: tk.BooleanVar = tk.BooleanVar(value=False)  # File logging off by default
+		self._progress_var: tk.IntVar = tk.IntVar(value=0)  # Languages loaded so far
 
 		# Widget references — cast(T, None) satisfies the type checker without | None cascades;
-		# all three are fully assigned during create_widgets() before any other code runs.
+		# all of them are fully assigned during create_widgets() before any other code runs.
 		self.tree: ttk.Treeview = cast(ttk.Treeview, cast(object, None))
+		self.gen_button: ttk.Button = cast(ttk.Button, cast(object, None))
+		self.progress_bar: ttk.Progressbar = cast(ttk.Progressbar, cast(object, None))
 		self.log_output: tk.Text = cast(tk.Text, cast(object, None))
 		self.log_frame: ttk.Frame = cast(ttk.Frame, cast(object, None))
-		self._file_handler: logging.FileHandler | None = None
+		self._file_handler: logging.handlers.MemoryHandler | None = None
+		self._log_handler: TextHandler = cast(TextHandler, cast(object, None))
 
-		# Per-language word lists, filled on first use. Walking all of WordNet is
-		# expensive and the result does not change during a session.
+		# Per-language lists of usable words. Walking all of WordNet is expensive and
+		# the result does not change during a session, so every language is built
+		# once on the background thread started below.
 		self._word_cache: dict[str, list[str]] = {}
-
-		logger.debug("Ensuring required NLTK data is available...")
-		self.ensure_nltk_data()
+		# The same lists with each case style already applied, keyed by case style
+		# and then language code, so a click never re-cases a word.
+		self._cased_words: dict[str, dict[str, list[str]]] = {}
+		self._cache_lock = Lock()
+		self._ready = Event()
+		# Languages finished by the background build. Written by that thread and
+		# only read by _poll_progress, so a plain int is enough.
+		self._progress = 0
+
+		# Private generator, so sampling does not share state with other users of
+		# the module-level random functions
+		self._rng = random.Random()
 
 		# Define supported languages with their codes and display names
 		self.language_names: dict[str, str] = {
@@ -153,13 +235,39 @@ class UsernameGenerator:
 			"lit": "Lithuanian"
 		}
 		self.language_codes: list[str] = list(self.language_names.keys())
-
-		# Initialize profanity filter
-		profanity.load_censor_words()
+		# (code, display name) pairs, so sampling yields the name without a lookup
+		self._lang_pairs: tuple[tuple[str, str], ...] = tuple(self.language_names.items())
 
 		# Setup GUI components
 		self.create_widgets()
 
+		# Load NLTK data, the profanity list and the word cache without blocking the
+		# window. Started after the widgets exist so its progress reaches the log.
+		logger.info("Loading word lists in the background...")
+		Thread(target=self._bootstrap, daemon=True).start()
+
+	def _bootstrap(self) -> None:
+		"""
+		Prepare everything generation needs, then signal readiness.
+
+		Runs on a background thread. The ready flag is set even if a step fails,
+		so a click never waits forever; missing data shows up as languages with
+		no usable words instead.
+		"""
+		try:
+			logger.debug("Ensuring required NLTK data is available...")
+			self.ensure_nltk_data()
+
+			# Initialize profanity filter before the cache build relies on it
+			profanity.load_censor_words()
+
+			self._prebuild_cache()
+			logger.info("Word lists ready.")
+		except Exception:
+			logger.error("Background loading failed", exc_info=True)
+		finally:
+			self._ready.set()
+
 	@staticmethod
 	def _resource_available(resource_path: str) -> bool:
 		"""
@@ -316,13 +424,14 @@ class UsernameGenerator:
 				value=value
 			).pack(anchor="w")
 
-		# Add generation button
-		gen_button: ttk.Button = ttk.Button(
+		# Add generation button, disabled until the word lists have loaded
+		self.gen_button = ttk.Button(
 			main_frame,
 			text="Generate Usernames",
-			command=self.start_generation_thread
+			command=self.start_generation_thread,
+			state="disabled"
 		)
-		gen_button.grid(row=1, column=0, columnspan=2, pady=10)
+		self.gen_button.grid(row=1, column=0, columnspan=2, pady=10)
 
 		# Add informational label
 		ttk.Label(
@@ -346,6 +455,32 @@ class UsernameGenerator:
 			command=self._toggle_file_logging
 		).grid(row=3, column=0, columnspan=3, sticky="w", padx=5)
 
+		# Show word list loading progress; hidden once loading is done
+		self.progress_bar = ttk.Progressbar(
+			main_frame,
+			mode="determinate",
+			variable=self._progress_var,
+			maximum=len(self.language_codes)
+		)
+		self.progress_bar.grid(row=4, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+		self.root.after(100, self._poll_progress)
+
+	def _poll_progress(self) -> None:
+		"""
+		Mirror background loading progress into the progress bar.
+
+		Reschedules itself every 100 ms until loading finishes, then hides the
+		bar and enables the Generate button.
+		"""
+		if self._ready.is_set():
+			self._progress_var.set(len(self.language_codes))
+			self.progress_bar.grid_remove()
+			self.gen_button.configure(state="normal")
+			return
+
+		self._progress_var.set(self._progress)
+		self.root.after(100, self._poll_progress)
+
 	def setup_treeview(self, parent_frame: ttk.Frame) -> None:
 		"""
 		Create and configure the Treeview widget for displaying usernames.
@@ -420,11 +555,26 @@ class UsernameGenerator:
 		self.log_output.configure(yscrollcommand=scrollbar.set)
 
 		# Configure log redirection
-		log_handler = TextHandler(self.log_output)
-		log_handler.setFormatter(
+		self._log_handler = TextHandler(self.log_output)
+		self._log_handler.setFormatter(
 			logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 		)
-		logger.addHandler(log_handler)
+		logger.addHandler(self._log_handler)
+		self.root.after(LOG_POLL_MS, self._drain_log)
+
+	def _drain_log(self) -> None:
+		"""
+		Flush queued log records into the log window and trim old lines.
+
+		Reschedules itself, so it runs every LOG_POLL_MS for the life of the window.
+		"""
+		self._log_handler.drain()
+
+		line_count = int(self.log_output.index("end-1c").split(".")[0])
+		if line_count > MAX_LOG_LINES:
+			self.log_output.delete("1.0", f"end-{MAX_LOG_LINES}l")
+
+		self.root.after(LOG_POLL_MS, self._drain_log)
 
 	def _toggle_file_logging(self) -> None:
 		"""Create and attach (or detach) the file handler based on the checkbox."""
@@ -438,15 +588,33 @@ class UsernameGenerator:
 			file_handler.setFormatter(
 				logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 			)
-			self._file_handler = file_handler
+			# Buffer records so a generation run is written in a few large writes
+			# rather than one per record. Errors are written straight through.
+			self._file_handler = logging.handlers.MemoryHandler(
+				capacity=200,
+				flushLevel=logging.ERROR,
+				target=file_handler
+			)
 			logger.addHandler(self._file_handler)
 			logger.info("File logging enabled: ascii_username_generator.log")
 		else:
-			if self._file_handler is not None:
-				handler = self._file_handler
-				logger.removeHandler(handler)
-				handler.close()
-				self._file_handler = None
+			self._close_file_logging()
+
+	def _close_file_logging(self) -> None:
+		"""Detach the file handler, writing out anything still buffered."""
+		if self._file_handler is not None:
+			handler = self._file_handler
+			logger.removeHandler(handler)
+			target = handler.target
+			handler.close()  # Flushes the buffer to the file first
+			if target is not None:
+				target.close()
+			self._file_handler = None
+
+	def _on_close(self) -> None:
+		"""Flush buffered file logs before the window is destroyed."""
+		self._close_file_logging()
+		self.root.destroy()
 
 	def start_generation_thread(self) -> None:
 		"""
@@ -458,13 +626,18 @@ class UsernameGenerator:
 		"""
 		Generate and display a set of random usernames.
 		"""
+		# Read each option once; every .get() is a round-trip into Tcl
+		case = self.case_var.get()
+		style = self.number_var.get()
+		count = self.count_var.get()
+
 		# Validate that all options have been selected before proceeding
 		missing = []
-		if not self.case_var.get():
+		if not case:
 			missing.append("Username Case")
-		if not self.number_var.get():
+		if not style:
 			missing.append("Number Style")
-		if not self.count_var.get():
+		if not count:
 			missing.append("Generation Size")
 		if missing:
 			messagebox.showwarning(
@@ -474,102 +647,248 @@ class UsernameGenerator:
 			return
 
 		logger.info("Starting username generation...")
-		self.log_output.insert(tk.END, "Generating usernames...\n")
-		self.log_output.see(tk.END)
-
-		# Clear existing usernames
-		for row in self.tree.get_children():
-			self.tree.delete(row)
-
-		usernames = []
-		total = int(self.count_var.get())
-
-		# Languages that yield nothing usable are dropped for the rest of the run,
-		# so one empty corpus cannot consume every attempt.
-		available_codes = list(self.language_codes)
-
-		for i in range(total):
-			if not available_codes:
-				logger.error("No language has usable words. Stopping generation.")
-				break
-
-			message = f"Generating username {i + 1}/{total}..."
-			logger.info(message)
-			self.log_output.insert(tk.END, f"{message}\n")
-			self.log_output.see(tk.END)
-
-			lang_code = random.choice(available_codes)
-			username = self.generate_ascii_username(lang_code)
-			if username is None:
-				available_codes.remove(lang_code)
-				continue
-			usernames.append((username, self.language_names.get(lang_code, lang_code)))
+		status_lines = ["Generating usernames..."]
+
+		usernames: list[tuple[str, str]] = []
+		total = int(count)
+
+		# Languages that yield nothing usable are left out up front, so every
+		# pick lands on a language that can supply a word.
+		available_langs = []
+		for lang_code, lang_name in self._lang_pairs:
+			if self.get_words(lang_code):
+				available_langs.append((lang_code, lang_name))
+			else:
+				logger.warning("No usable words for '%s'; dropping it from this run.", lang_code)
+
+		if not available_langs:
+			logger.error("No language has usable words. Stopping generation.")
+		else:
+			# Draw every language, then every word per language, in batched calls
+			lang_counts = Counter(self._rng.choices(available_langs, k=total))
+			for (lang_code, lang_name), picks in lang_counts.items():
+				# Words come pre-cased from the cache, so only the suffix is left
+				words = self._rng.choices(self.get_words(lang_code, case), k=picks)
+				for username in self._append_suffixes(words, style):
+					usernames.append((username, lang_name))
 
-		usernames.sort(key=lambda x: x[0])
-		for username, lang_name in usernames:
-			self.tree.insert("", "end", values=(username, lang_name))
+		usernames.sort(key=itemgetter(0))
 
 		if len(usernames) < total:
 			shortfall = (
 				f"Generated {len(usernames)} of {total} requested; "
-				"some languages had no usable words."
+				"no language had usable words."
 			)
 			logger.warning(shortfall)
-			self.log_output.insert(tk.END, f"{shortfall}\n")
+			status_lines.append(shortfall)
 		else:
 			logger.info("Username generation completed successfully.")
-			self.log_output.insert(tk.END, "Username generation completed successfully.\n")
-		self.log_output.see(tk.END)
+			status_lines.append("Username generation completed successfully.")
+
+		# Hand the finished batch to the Tk thread in one callback
+		self.root.after(0, self._show_results, usernames, status_lines)
+
+	def _show_results(self, usernames: list[tuple[str, str]], status_lines: list[str]) -> None:
+		"""
+		Replace the table contents and append status lines in a single Tk callback.
+
+		Runs on the Tk thread. Tk defers redraws until it is idle, so filling the
+		table and log here costs one redraw rather than one per row.
+
+		Args:
+			usernames (list[tuple[str, str]]): (username, language name) rows to show.
+			status_lines (list[str]): Lines to append to the log window.
+		"""
+		# Take the table out of the layout while it is refilled so Tk does not
+		# re-measure it per row; grid_remove() keeps its grid options for grid().
+		self.tree.grid_remove()
+		children = self.tree.get_children()
+		if children:
+			self.tree.delete(*children)  # One Tcl call for every row
+		for row in usernames:
+			self.tree.insert("", "end", values=row)
+		self.tree.grid()
+
+		append_to_log(self.log_output, "\n".join(status_lines) + "\n")
+
+		# Write this run's buffered file log records in one go
+		if self._file_handler is not None:
+			self._file_handler.flush()
 
-	def generate_ascii_username(self, lang_code: str) -> str | None:
+	def get_words(self, lang_code: str, case: str = "") -> list[str]:
 		"""
-		Generate a single ASCII-compliant username for specified language.
+		Retrieve usable words from the word cache for specified language.
+
+		Blocks until background loading has finished.
 
 		Args:
-			lang_code (str): The language code to use for word selection.
+			lang_code (str): The language code to fetch words for.
+			case (str): Case style the words should already have. Empty or unknown
+				styles return the words as WordNet spells them.
 
 		Returns:
-			str | None: A formatted username, or None if the language yields no
-			usable words.
-		"""
-		valid_words = self._word_cache.get(lang_code)
-		if valid_words is None:
-			words = self.get_words(lang_code)
-			valid_words = [word for word in words if self.is_valid_word(word)]
-			self._word_cache[lang_code] = valid_words
-			logger.debug(
-				"Cached %d usable words for '%s' (from %d lemmas).",
-				len(valid_words), lang_code, len(words)
-			)
+			list[str]: List of valid words for the specified language.
+		"""
+		self._ready.wait()
+		source = self._cased_words.get(case, self._word_cache)
+		return source.get(lang_code, [])
+
+	def _prebuild_cache(self) -> None:
+		"""
+		Fill the word cache for every supported language from WordNet's lemma index.
+
+		Lists saved by an earlier run are reused when their key still matches;
+		otherwise they are rebuilt and saved again.
+
+		Safe to call more than once or from several threads; only the first call
+		does any work. A language whose lemmas cannot be read ends up with an
+		empty list rather than stopping the other languages.
+
+		Words are filtered here, profanity included, so the click path only has
+		to pick from lists that are already clean. Many words are shared between
+		languages, so each distinct word is judged once.
+		"""
+		with self._cache_lock:
+			if self._word_cache:
+				return
+
+			cache_key = self._word_cache_key()
+			if cache_key is not None:
+				stored = self._load_word_cache(cache_key)
+				if stored is not None:
+					self._word_cache = stored
+					self._build_case_variants()
+					self._progress = len(self.language_codes)
+					logger.info("Loaded word lists from %s", WORD_CACHE_PATH)
+					return
+
+			words: dict[str, list[str]] = {}
+			verdicts: dict[str, bool] = {}
+			complete = True
+			for lang_code in self.language_codes:
+				bucket: list[str] = []
+				try:
+					# Reads the per-language index directly instead of probing every
+					# synset, most of which have no lemma outside English.
+					for word in wordnet.words(lang=lang_code):
+						usable = verdicts.get(word)
+						if usable is None:
+							# Cheapest test first: is_valid_word only reads the length
+							# and the string's ASCII flag, so it rejects most non-ASCII
+							# lemmas before isalnum() has to scan them.
+							usable = (
+								self.is_valid_word(word)
+								and word.isalnum()
+								and not profanity.contains_profanity(word)
+							)
+							verdicts[word] = usable
+						if usable:
+							bucket.append(word)
+				except Exception as exc:
+					logger.warning("Failed to fetch words for '%s': %s", lang_code, exc)
+					bucket = []
+					complete = False
+				words[lang_code] = bucket
+				self._progress += 1
+				logger.debug("Cached %d usable words for '%s'.", len(bucket), lang_code)
+
+			self._word_cache = words
+			self._build_case_variants()
+
+			# A partial build reflects missing data, not the corpus; rebuild next run
+			if cache_key is not None and complete:
+				self._save_word_cache(cache_key, words)
+
+	def _build_case_variants(self) -> None:
+		"""
+		Derive a copy of every word list per case style from the base word cache.
+
+		Costs roughly three times the memory of the base lists, and is rebuilt
+		from them rather than saved to disk.
+		"""
+		self._cased_words = {
+			case: {
+				lang_code: [fmt(word) for word in words]
+				for lang_code, words in self._word_cache.items()
+			}
+			for case, fmt in self._CASE_FORMATS.items()
+		}
 
-		if not valid_words:
-			logger.warning("No usable words for '%s'; dropping it from this run.", lang_code)
-			return None
+	def _word_cache_key(self) -> tuple[object, ...] | None:
+		"""
+		Describe the inputs the word cache was built from.
 
-		return self.finalize_username(random.choice(valid_words))
+		Must run after profanity.load_censor_words(), since the saved lists have
+		already been filtered against whatever censor list is loaded.
+
+		Returns:
+			tuple[object, ...] | None: Cache format, NLTK and WordNet versions, the
+			language codes and a digest of the censor list, or None if any of
+			these cannot be determined.
+		"""
+		try:
+			wordnet_version = wordnet.get_version()
+			censor_words = sorted(str(word) for word in profanity.CENSOR_WORDSET)
+		except Exception as exc:
+			logger.debug("Not using the disk word cache: %s", exc)
+			return None
+		# Changes whenever better_profanity's list does, upgrade or not
+		censor_digest = hashlib.sha256("\n".join(censor_words).encode("utf-8")).hexdigest()
+		return (
+			WORD_CACHE_FORMAT,
+			nltk.__version__,
+			wordnet_version,
+			tuple(self.language_codes),
+			censor_digest,
+		)
 
 	@staticmethod
-	def get_words(lang_code: str) -> list[str]:
+	def _load_word_cache(cache_key: tuple[object, ...]) -> dict[str, list[str]] | None:
 		"""
-		Retrieve valid words from WordNet for specified language.
+		Read word lists saved by a previous run if they match the current inputs.
 
 		Args:
-			lang_code (str): The language code to fetch words for.
+			cache_key (tuple[object, ...]): Key the stored lists must have been saved under.
 
 		Returns:
-			list[str]: List of valid words for the specified language.
+			dict[str, list[str]] | None: The stored lists, or None if there is no
+			usable file.
 		"""
-		words = []
 		try:
-			for synset in wordnet.all_synsets():
-				for lemma in synset.lemmas(lang=lang_code):
-					word = lemma.name()
-					if word.isalnum():
-						words.append(word)
+			with open(WORD_CACHE_PATH, "rb") as cache_file:
+				stored_key, words = pickle.load(cache_file)
+		except FileNotFoundError:
+			return None
 		except Exception as exc:
-			logger.warning("Failed to fetch words for '%s': %s", lang_code, exc)
+			logger.warning("Ignoring unreadable word cache %s: %s", WORD_CACHE_PATH, exc)
+			return None
+
+		if stored_key != cache_key:
+			logger.info("Word cache on disk is out of date; rebuilding.")
+			return None
 		return words
 
+	@staticmethod
+	def _save_word_cache(cache_key: tuple[object, ...], words: dict[str, list[str]]) -> None:
+		"""
+		Write word lists to disk for the next run. Failure is logged, not raised.
+
+		Args:
+			cache_key (tuple[object, ...]): Key to store alongside the lists.
+			words (dict[str, list[str]]): Word lists by language code.
+		"""
+		temp_path = WORD_CACHE_PATH + ".tmp"
+		try:
+			os.makedirs(os.path.dirname(WORD_CACHE_PATH), exist_ok=True)
+			with open(temp_path, "wb") as cache_file:
+				pickle.dump((cache_key, words), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+			# Swap in whole so a crash mid-write never leaves a truncated cache
+			os.replace(temp_path, WORD_CACHE_PATH)
+		except OSError as exc:
+			logger.warning("Could not save word cache to %s: %s", WORD_CACHE_PATH, exc)
+			return
+		logger.info("Saved word lists to %s", WORD_CACHE_PATH)
+
 	@staticmethod
 	def is_valid_word(word: str, min_len: int = 3) -> bool:
 		"""
@@ -582,34 +901,25 @@ class UsernameGenerator:
 		Returns:
 			bool: True if word meets all criteria, False otherwise.
 		"""
-		return all(ord(c) < 128 for c in word) and len(word) >= min_len
+		# Length first: it is O(1) and rejects short words without scanning them
+		return len(word) >= min_len and word.isascii()
 
-	def finalize_username(self, word: str) -> str:
+	def _append_suffixes(self, words: list[str], style: str) -> list[str]:
 		"""
-		Apply final formatting to username.
+		Append a random number suffix in the given style to each word.
 
 		Args:
-			word (str): Base word to format into username.
+			words (list[str]): Words that already have their final case.
+			style (str): Number style, one of "none", "1digit", "2digit" or "3digit".
 
 		Returns:
-			str: Formatted username string with applied case and optional number suffix.
+			list[str]: The words with suffixes, or the words unchanged for "none".
 		"""
-		case = self.case_var.get()
-		if case == "lowercase":
-			word = word.lower()
-		elif case == "uppercase":
-			word = word.upper()
-		elif case == "capitalize":
-			word = word.capitalize()
-
-		style = self.number_var.get()
-		if style == "1digit":
-			word += str(random.randint(0, 9))
-		elif style == "2digit":
-			word += f"{random.randint(0, 99):02d}"
-		elif style == "3digit":
-			word += f"{random.randint(0, 999):03d}"
-		return word
+		pool = self._SUFFIX_POOLS.get(style)
+		if not pool:
+			return words
+		suffixes = self._rng.choices(pool, k=len(words))
+		return [word + suffix for word, suffix in zip(words, suffixes)]
 
 	def on_username_click(self, event: tk.Event) -> None:
 		"""